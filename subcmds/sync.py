@@ -99,6 +99,14 @@ def _SafeCheckoutOrder(checkouts: List[Project]) -> List[List[Project]]:
     E.g. if foo, foo/bar and foo/bar/baz are project paths, then foo needs to
     finish before foo/bar can proceed, and foo/bar needs to finish before
     foo/bar/baz."""
+    # Manifests without nested projects (no "/" anywhere) are the common
+    # case and need no hierarchy tracking: everything can go in one
+    # batch, skipping the Path construction and prefix checks below.
+    if len(checkouts) <= 1 or not any(
+        "/" in checkout.relpath for checkout in checkouts
+    ):
+        return [sorted(checkouts, key=lambda x: x.relpath)]
+
     res = [[]]
     current = res[0]
 
@@ -15,6 +15,7 @@
 """Common fixtures for pytests."""
 
 import pathlib
+import tempfile
 
 import pytest
 
@@ -74,6 +75,31 @@ def tmp_home_dir(monkeypatch, tmp_path_factory):
     return _set_home(monkeypatch, tmp_path_factory.mktemp("home"))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def private_tempfile_root(tmp_path_factory, monkeysession):
+    """Point tempfile at a tmp root private to this test session.
+
+    tmp_path_factory's basetemp is unique per pytest-xdist worker, so tests
+    that call tempfile.mkdtemp() directly can't collide across workers.
+    """
+    root = tmp_path_factory.mktemp("tempfile")
+    monkeysession.setattr(tempfile, "tempdir", str(root))
+    return root
+
+
+@pytest.fixture(scope="session")
+def sync_parser():
+    """Session-wide OptionParser for the sync subcommand.
+
+    The option grammar is static, so pure argument-parsing tests can
+    share one parser for the whole session instead of constructing a
+    Sync() per test; parse_args returns a fresh Values every call.
+    """
+    from subcmds import sync
+
+    return sync.Sync().OptionParser
+
+
 @pytest.fixture(autouse=True)
 def setup_user_identity(monkeysession, scope="session"):
     """Set env variables for author and committer name and email."""
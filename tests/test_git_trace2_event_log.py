@@ -34,7 +34,7 @@ def serverLoggingThread(socket_path, server_ready, received_traces):
 
     Args:
         socket_path: path to a Unix domain socket on which to listen for traces
-        server_ready: a threading.Condition used to signal to the caller that
+        server_ready: a threading.Event used to signal to the caller that
             this thread is ready to accept connections
         received_traces: a list to which received traces will be appended (after
             decoding to a utf-8 string).
@@ -44,8 +44,9 @@ def serverLoggingThread(socket_path, server_ready, received_traces):
     with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
         sock.bind(socket_path)
         sock.listen(0)
-        with server_ready:
-            server_ready.notify()
+        # An Event (unlike a Condition notify) stays set, so the main
+        # thread cannot miss the signal if it gets here late.
+        server_ready.set()
         with sock.accept()[0] as conn:
             while True:
                 recved = conn.recv(4096)
@@ -376,7 +377,7 @@ class EventLogTestCase(unittest.TestCase):
             prefix="test_server_sockets"
         ) as tempdir:
             socket_path = os.path.join(tempdir, "server.sock")
-            server_ready = threading.Condition()
+            server_ready = threading.Event()
             # Start "server" listening on Unix domain socket at socket_path.
             server_thread = threading.Thread(
                 target=serverLoggingThread,
@@ -385,8 +386,7 @@ class EventLogTestCase(unittest.TestCase):
             try:
                 server_thread.start()
 
-                with server_ready:
-                    server_ready.wait(timeout=120)
+                server_ready.wait(timeout=120)
 
                 self._event_log_module.StartEvent([])
                 path = self._event_log_module.Write(
@@ -11,13 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Unittests for the subcmds/sync.py module."""
+"""Unittests for the subcmds/sync.py module.
 
+The suite is parallel-safe under run_tests' pytest-xdist invocation,
+which distributes whole files (--dist loadfile), so all tests here
+share one worker process and its class-level fixtures.
+"""
+
+import contextlib
+import copy
 import json
 import os
 import shutil
 import tempfile
 import time
+import types
 import unittest
 from unittest import mock
 
@@ -30,6 +38,32 @@ from project import SyncNetworkHalfResult
 from subcmds import sync
 
 
+# The sync option grammar is static, so one parser serves the whole
+# module; parse_args hands back a fresh Values every call.  The baseline
+# empty-argv parse is done once and cloned on demand.
+_CACHED_PARSER = sync.Sync().OptionParser
+_BASELINE_OPTS, _ = _CACHED_PARSER.parse_args([])
+
+
+def _parse_default_opts(argv=()):
+    """Return parsed sync options, cloning the baseline for empty argv."""
+    if not argv:
+        return copy.copy(_BASELINE_OPTS)
+    opt, _ = _CACHED_PARSER.parse_args(list(argv))
+    return opt
+
+
+@pytest.fixture(scope="module")
+def sync_cmd():
+    """One Sync command per module.
+
+    Building Sync() and its OptionParser walks the whole option
+    registration; the parser is static, so share a single instance
+    across every parametrized case instead of rebuilding it per test.
+    """
+    return sync.Sync()
+
+
 @pytest.mark.parametrize(
     "use_superproject, cli_args, result",
     [
@@ -41,74 +75,115 @@ from subcmds import sync
         (False, [], None),
     ],
 )
-def test_get_current_branch_only(use_superproject, cli_args, result):
+def test_get_current_branch_only(use_superproject, cli_args, result, sync_cmd):
     """Test Sync._GetCurrentBranchOnly logic.
 
     Sync._GetCurrentBranchOnly should return True if a superproject is
     requested, and otherwise the value of the current_branch_only option.
     """
-    cmd = sync.Sync()
-    opts, _ = cmd.OptionParser.parse_args(cli_args)
+    opts, _ = sync_cmd.OptionParser.parse_args(cli_args)
 
     with mock.patch(
         "git_superproject.UseSuperproject", return_value=use_superproject
     ):
-        assert cmd._GetCurrentBranchOnly(opts, cmd.manifest) == result
+        assert sync_cmd._GetCurrentBranchOnly(opts, sync_cmd.manifest) == result
 
 
 # Used to patch os.cpu_count() for reliable results.
 OS_CPU_COUNT = 24
 
+# Fixed wall clock for the frozen_time fixture below.
+_FROZEN_TIME = 1_700_000_000.0
+
+# Shared success result for mocked Sync_NetworkHalf calls.
+# SyncNetworkHalfResult is a NamedTuple, so one immutable instance can
+# serve every success site.
+_OK_FETCH = SyncNetworkHalfResult(error=None, remote_fetched=True)
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    """Freeze time.time for deterministic age math.
+
+    The cache-expiry and FETCH_HEAD-staleness checks all compare
+    time.time() against stored timestamps; pinning the clock removes
+    wall-clock jitter and the clock_gettime syscalls.  LocalSyncState
+    installs its own class-scoped time.time patch, which takes
+    precedence when active.
+    """
+    if isinstance(time.time, mock.Mock):
+        yield
+        return
+    monkeypatch.setattr(time, "time", lambda: _FROZEN_TIME)
+    yield
+
+
+# --jobs matrix: (argv, jobs_manifest, jobs, jobs_net, jobs_check).
+# Built once at import instead of inside the decorator call.
+_CLI_JOBS_CASES = [
+    # No user or manifest settings.
+    ([], None, OS_CPU_COUNT, 1, command.DEFAULT_LOCAL_JOBS),
+    # No user settings, so manifest settings control.
+    ([], 3, 3, 3, 3),
+    # User settings, but no manifest.
+    (["--jobs=4"], None, 4, 4, 4),
+    (["--jobs=4", "--jobs-network=5"], None, 4, 5, 4),
+    (["--jobs=4", "--jobs-checkout=6"], None, 4, 4, 6),
+    (["--jobs=4", "--jobs-network=5", "--jobs-checkout=6"], None, 4, 5, 6),
+    (
+        ["--jobs-network=5"],
+        None,
+        OS_CPU_COUNT,
+        5,
+        command.DEFAULT_LOCAL_JOBS,
+    ),
+    (["--jobs-checkout=6"], None, OS_CPU_COUNT, 1, 6),
+    (["--jobs-network=5", "--jobs-checkout=6"], None, OS_CPU_COUNT, 5, 6),
+    # User settings with manifest settings.
+    (["--jobs=4"], 3, 4, 4, 4),
+    (["--jobs=4", "--jobs-network=5"], 3, 4, 5, 4),
+    (["--jobs=4", "--jobs-checkout=6"], 3, 4, 4, 6),
+    (["--jobs=4", "--jobs-network=5", "--jobs-checkout=6"], 3, 4, 5, 6),
+    (["--jobs-network=5"], 3, 3, 5, 3),
+    (["--jobs-checkout=6"], 3, 3, 3, 6),
+    (["--jobs-network=5", "--jobs-checkout=6"], 3, 3, 5, 6),
+    # Settings that exceed rlimits get capped.
+    (["--jobs=1000000"], None, 83, 83, 83),
+    ([], 1000000, 83, 83, 83),
+]
+
 
 @pytest.mark.parametrize(
-    "argv, jobs_manifest, jobs, jobs_net, jobs_check",
-    [
-        # No user or manifest settings.
-        ([], None, OS_CPU_COUNT, 1, command.DEFAULT_LOCAL_JOBS),
-        # No user settings, so manifest settings control.
-        ([], 3, 3, 3, 3),
-        # User settings, but no manifest.
-        (["--jobs=4"], None, 4, 4, 4),
-        (["--jobs=4", "--jobs-network=5"], None, 4, 5, 4),
-        (["--jobs=4", "--jobs-checkout=6"], None, 4, 4, 6),
-        (["--jobs=4", "--jobs-network=5", "--jobs-checkout=6"], None, 4, 5, 6),
-        (
-            ["--jobs-network=5"],
-            None,
-            OS_CPU_COUNT,
-            5,
-            command.DEFAULT_LOCAL_JOBS,
-        ),
-        (["--jobs-checkout=6"], None, OS_CPU_COUNT, 1, 6),
-        (["--jobs-network=5", "--jobs-checkout=6"], None, OS_CPU_COUNT, 5, 6),
-        # User settings with manifest settings.
-        (["--jobs=4"], 3, 4, 4, 4),
-        (["--jobs=4", "--jobs-network=5"], 3, 4, 5, 4),
-        (["--jobs=4", "--jobs-checkout=6"], 3, 4, 4, 6),
-        (["--jobs=4", "--jobs-network=5", "--jobs-checkout=6"], 3, 4, 5, 6),
-        (["--jobs-network=5"], 3, 3, 5, 3),
-        (["--jobs-checkout=6"], 3, 3, 3, 6),
-        (["--jobs-network=5", "--jobs-checkout=6"], 3, 3, 5, 6),
-        # Settings that exceed rlimits get capped.
-        (["--jobs=1000000"], None, 83, 83, 83),
-        ([], 1000000, 83, 83, 83),
-    ],
+    "argv, jobs_manifest, jobs, jobs_net, jobs_check", _CLI_JOBS_CASES
 )
-def test_cli_jobs(argv, jobs_manifest, jobs, jobs_net, jobs_check):
+@mock.patch.object(os, "cpu_count", return_value=OS_CPU_COUNT)
+@mock.patch.object(sync, "_rlimit_nofile", return_value=(256, 256))
+def test_cli_jobs(
+    _rlimit_mock,
+    _cpu_count_mock,
+    argv,
+    jobs_manifest,
+    jobs,
+    jobs_net,
+    jobs_check,
+    sync_cmd,
+):
     """Tests --jobs option behavior."""
-    mp = mock.MagicMock()
-    mp.manifest.default.sync_j = jobs_manifest
+    # _ValidateOptionsWithManifest only reads manifest.default.sync_j,
+    # so a plain namespace chain beats a MagicMock tree.
+    mp = types.SimpleNamespace(
+        manifest=types.SimpleNamespace(
+            default=types.SimpleNamespace(sync_j=jobs_manifest)
+        )
+    )
 
-    cmd = sync.Sync()
-    opts, args = cmd.OptionParser.parse_args(argv)
-    cmd.ValidateOptions(opts, args)
+    opts, args = sync_cmd.OptionParser.parse_args(argv)
+    sync_cmd.ValidateOptions(opts, args)
 
-    with mock.patch.object(sync, "_rlimit_nofile", return_value=(256, 256)):
-        with mock.patch.object(os, "cpu_count", return_value=OS_CPU_COUNT):
-            cmd._ValidateOptionsWithManifest(opts, mp)
-            assert opts.jobs == jobs
-            assert opts.jobs_network == jobs_net
-            assert opts.jobs_checkout == jobs_check
+    sync_cmd._ValidateOptionsWithManifest(opts, mp)
+    assert opts.jobs == jobs
+    assert opts.jobs_network == jobs_net
+    assert opts.jobs_checkout == jobs_check
 
 
 @pytest.mark.parametrize(
@@ -129,58 +204,181 @@ def test_cli_jobs(argv, jobs_manifest, jobs, jobs_net, jobs_check):
         (["--use-overlay", "--overlay-auto=cached"], True, "cached"),
     ],
 )
-def test_use_overlay_option(argv, use_overlay_expected, overlay_auto_expected):
+def test_use_overlay_option(
+    argv, use_overlay_expected, overlay_auto_expected, sync_parser
+):
     """Tests --use-overlay and --overlay-auto option behavior."""
-    cmd = sync.Sync()
-    opts, args = cmd.OptionParser.parse_args(argv)
+    opts, args = sync_parser.parse_args(argv)
 
     assert opts.use_overlay == use_overlay_expected
     assert getattr(opts, 'overlay_auto', None) == overlay_auto_expected
 
 
-class UseOverlayInteractiveSelection(unittest.TestCase):
-    """Tests for --use-overlay interactive project selection."""
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["--use-overlay", "--overlay-auto=new"], "new"),
+        (["--use-overlay", "--overlay-auto=outdated"], "outdated"),
+        (["--use-overlay", "--overlay-auto=all"], "all"),
+        (["--use-overlay", "--overlay-auto=cached"], "cached"),
+    ],
+)
+def test_overlay_auto_option_parsing(argv, expected, sync_parser):
+    """Test that --overlay-auto options are parsed correctly."""
+    opt, _ = sync_parser.parse_args(argv)
+    assert opt.overlay_auto == expected
+
+
+@pytest.fixture(scope="module")
+def overlay_projects():
+    """Immutable project stand-ins shared by the selection tests."""
+    return [
+        types.SimpleNamespace(
+            name="project1", relpath="path/to/project1", Exists=True
+        ),
+        types.SimpleNamespace(
+            name="project2", relpath="path/to/project2", Exists=False
+        ),
+        types.SimpleNamespace(
+            name="project3", relpath="path/to/project3", Exists=True
+        ),
+    ]
 
-    def setUp(self):
-        """Common setup."""
-        # Create temporary directory for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_dir = os.path.join(self.temp_dir, '.repo')
-        os.makedirs(self.repo_dir)
 
-        # Create sync command with proper mocking
-        self.cmd = sync.Sync()
+@pytest.fixture(scope="module")
+def overlay_cmd():
+    """A Sync command for interactive selection tests.
+
+    Shared at module scope to amortize Sync() construction; each test
+    reinstalls the status/cache mocks it relies on.
+    """
+    cmd = sync.Sync()
+    # The selection code only reads manifest.repodir off outer_client,
+    # so a namespace chain is all it takes.
+    cmd.outer_client = types.SimpleNamespace(
+        manifest=types.SimpleNamespace(repodir="/nonexistent/.repo")
+    )
+    return cmd
+
+
+# Interactive selection matrix:
+# (test id, input side effect, indices of outdated projects, indices
+# returned by the custom selection (None = not used), expected selected
+# indices).
+_INTERACTIVE_SELECTION_CASES = [
+    ("all", ["3"], (), None, [0, 1, 2]),
+    ("none", ["5"], (), None, []),
+    ("empty_default_all", ["3"], (), None, [0, 1, 2]),
+    ("specific_projects", ["4", "1 3", "y"], (), [0, 2], [0, 2]),
+    ("keyboard_interrupt", KeyboardInterrupt(), (), None, []),
+    ("eof_error", EOFError(), (), None, []),
+    ("invalid_then_valid", ["invalid", "1"], (0, 2), None, [1]),
+    ("confirm_no_then_yes", ["4", "1", "n", "2", "y"], (), [1], [1]),
+    ("new_projects_only", ["1"], (), None, [1]),
+    ("new_plus_outdated", ["2"], (0,), None, [1, 0]),
+]
 
-        # Mock outer_client to avoid AttributeError
-        self.cmd.outer_client = mock.MagicMock()
-        self.cmd.outer_client.manifest.repodir = self.repo_dir
 
-        # Create mock projects
-        self.project1 = mock.MagicMock()
-        self.project1.name = "project1"
-        self.project1.relpath = "path/to/project1"
-        self.project1.Exists = True
+@pytest.mark.parametrize(
+    "inputs, outdated, custom, expected",
+    [case[1:] for case in _INTERACTIVE_SELECTION_CASES],
+    ids=[case[0] for case in _INTERACTIVE_SELECTION_CASES],
+)
+@mock.patch("builtins.input")
+def test_interactive_selection(
+    mock_input, overlay_cmd, overlay_projects, inputs, outdated, custom, expected
+):
+    """Tests _InteractiveProjectSelection across the input matrix."""
+    mock_input.side_effect = inputs
+
+    overlay_cmd._IsProjectOutdated = mock.MagicMock(
+        side_effect=lambda p: overlay_projects.index(p) in outdated
+    )
+    overlay_cmd._LoadCachedSelection = mock.MagicMock(return_value=None)
+    overlay_cmd._SaveCachedSelection = mock.MagicMock()
+
+    expected_projects = [overlay_projects[i] for i in expected]
+    if custom is not None:
+        with mock.patch.object(
+            overlay_cmd,
+            "_CustomProjectSelection",
+            return_value=[overlay_projects[i] for i in custom],
+        ) as mock_custom:
+            result = overlay_cmd._InteractiveProjectSelection(
+                overlay_projects
+            )
+            mock_custom.assert_called_once()
+    else:
+        result = overlay_cmd._InteractiveProjectSelection(overlay_projects)
+
+    assert result == expected_projects
 
-        self.project2 = mock.MagicMock()
-        self.project2.name = "project2"
-        self.project2.relpath = "path/to/project2"
-        self.project2.Exists = False
 
-        self.project3 = mock.MagicMock()
-        self.project3.name = "project3"
-        self.project3.relpath = "path/to/project3"
-        self.project3.Exists = True
+def test_interactive_selection_empty_projects(overlay_cmd):
+    """Test interactive selection with empty project list."""
+    assert overlay_cmd._InteractiveProjectSelection([]) == []
 
-        self.all_projects = [self.project1, self.project2, self.project3]
 
-        # Mock the project status checking methods to avoid complex setup
-        self.cmd._IsProjectOutdated = mock.MagicMock(return_value=False)
-        self.cmd._LoadCachedSelection = mock.MagicMock(return_value=None)
-        self.cmd._SaveCachedSelection = mock.MagicMock()
+class OverlayTestCase(unittest.TestCase):
+    """Base class managing a shared temp root for the overlay tests.
+
+    The class-level root is created and removed once; each test only
+    pays for an os.makedirs of its private subdirectory instead of a
+    mkdtemp/rmtree pair.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._class_tmp = tempfile.mkdtemp(cls.__name__)
+        # The option grammar is static; build the parser once per class.
+        cls._parser = _CACHED_PARSER
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._class_tmp, ignore_errors=True)
+
+    def setUp(self):
+        """Create a private workspace with a .repo dir for this test."""
+        self.temp_dir = os.path.join(
+            self._class_tmp, self.id().rsplit(".", 1)[-1]
+        )
+        self.repo_dir = os.path.join(self.temp_dir, ".repo")
+        os.makedirs(self.repo_dir)
+        # Files the test creates, tracked for direct cleanup.
+        self._created = []
+
+    def _track(self, path):
+        """Record a file created by the test for direct removal."""
+        self._created.append(path)
+        return path
 
     def tearDown(self):
-        """Cleanup."""
-        shutil.rmtree(self.temp_dir)
+        """Remove known files directly instead of stat-walking the tree.
+
+        A couple of unlinks/rmdirs beat a recursive scandir walk; the
+        class-level rmtree in tearDownClass backstops anything the test
+        created without tracking.
+        """
+        for path in self._created[::-1] + [self.repo_dir, self.temp_dir]:
+            try:
+                os.unlink(path)
+            except OSError:
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
+
+
+class ParseProjectSelection(unittest.TestCase):
+    """Tests for the _ParseProjectSelection string parser.
+
+    Pure string-in/list-out parsing, so no workspace or mocks are
+    needed; one shared command instance covers the whole class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cmd = sync.Sync()
 
     def test_parse_project_selection_individual_numbers(self):
         """Test parsing individual project numbers."""
@@ -225,166 +423,74 @@ class UseOverlayInteractiveSelection(unittest.TestCase):
         result = self.cmd._ParseProjectSelection("0", 3)
         self.assertEqual(result, [])
 
-    @mock.patch('builtins.input')
-    def test_interactive_selection_all(self, mock_input):
-        """Test interactive selection with 'all' option (option 3)."""
-        mock_input.return_value = "3"  # Option 3 = sync all projects
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        self.assertEqual(result, self.all_projects)
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_none(self, mock_input):
-        """Test interactive selection with 'none' option (option 5)."""
-        mock_input.return_value = "5"  # Option 5 = skip sync
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        self.assertEqual(result, [])
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_empty_default_all(self, mock_input):
-        """Test interactive selection with empty input defaults to all (option 3)."""
-        mock_input.return_value = "3"  # Option 3 = sync all projects
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        self.assertEqual(result, self.all_projects)
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_specific_projects(self, mock_input):
-        """Test interactive selection with custom selection (option 4)."""
-        # Option 4 for custom selection, then "1 3" for specific projects, then "y" to confirm
-        mock_input.side_effect = ["4", "1 3", "y"]
-
-        # Mock the custom selection method to return expected projects
-        with mock.patch.object(self.cmd, '_CustomProjectSelection') as mock_custom:
-            mock_custom.return_value = [self.project1, self.project3]
-
-            result = self.cmd._InteractiveProjectSelection(self.all_projects)
-            expected = [self.project1, self.project3]
-            self.assertEqual(result, expected)
-            mock_custom.assert_called_once()
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_keyboard_interrupt(self, mock_input):
-        """Test interactive selection handles KeyboardInterrupt."""
-        mock_input.side_effect = KeyboardInterrupt()
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        self.assertEqual(result, [])
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_eof_error(self, mock_input):
-        """Test interactive selection handles EOFError."""
-        mock_input.side_effect = EOFError()
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        self.assertEqual(result, [])
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_invalid_then_valid(self, mock_input):
-        """Test interactive selection handles invalid input then valid input."""
-        mock_input.side_effect = ["invalid", "1"]  # Invalid option, then option 1 (new projects)
-
-        # Mock to simulate new projects only
-        self.cmd._IsProjectOutdated.return_value = True  # Make project2 appear as outdated
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        # Option 1 selects only new projects (project2 in this case)
-        expected = [self.project2]  # Only the non-existing project
-        self.assertEqual(result, expected)
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_confirm_no_then_yes(self, mock_input):
-        """Test interactive selection with rejection then confirmation."""
-        # Option 4 for custom, then "1" for first project, "n" to reject, "2" for second project, "y" to confirm
-        mock_input.side_effect = ["4", "1", "n", "2", "y"]
-
-        # Mock the custom selection method to handle the interaction
-        with mock.patch.object(self.cmd, '_CustomProjectSelection') as mock_custom:
-            mock_custom.return_value = [self.project2]
-
-            result = self.cmd._InteractiveProjectSelection(self.all_projects)
-            expected = [self.project2]
-            self.assertEqual(result, expected)
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_new_projects_only(self, mock_input):
-        """Test interactive selection option 1 (new projects only)."""
-        mock_input.return_value = "1"  # Option 1 = sync only new projects
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        # Should return only projects that don't exist (Exists = False)
-        expected = [self.project2]
-        self.assertEqual(result, expected)
-
-    @mock.patch('builtins.input')
-    def test_interactive_selection_new_plus_outdated(self, mock_input):
-        """Test interactive selection option 2 (new + outdated projects)."""
-        mock_input.return_value = "2"  # Option 2 = sync new + outdated projects
 
-        # Make project1 appear outdated
-        self.cmd._IsProjectOutdated.side_effect = lambda p: p == self.project1
-
-        result = self.cmd._InteractiveProjectSelection(self.all_projects)
-        # Should return new (project2) + outdated (project1) projects
-        expected = [self.project2, self.project1]
-        self.assertEqual(result, expected)
-
-    def test_interactive_selection_empty_projects(self):
-        """Test interactive selection with empty project list."""
-        result = self.cmd._InteractiveProjectSelection([])
-        self.assertEqual(result, [])
-
-
-class UseOverlayPerformanceFeatures(unittest.TestCase):
+class UseOverlayPerformanceFeatures(OverlayTestCase):
     """Tests for --use-overlay performance and automation features."""
 
     def setUp(self):
         """Common setup."""
+        super().setUp()
         self.cmd = sync.Sync()
 
-        # Create test directory structure
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_dir = os.path.join(self.temp_dir, '.repo')
-        os.makedirs(self.repo_dir)
-
-        # Mock outer client manifest
-        self.cmd.outer_client = mock.MagicMock()
-        self.cmd.outer_client.manifest.repodir = self.repo_dir
-
-        # Create mock projects with different states
-        self.new_project = mock.MagicMock()
-        self.new_project.name = "new_project"
-        self.new_project.relpath = "path/to/new_project"
-        self.new_project.Exists = False
-
-        self.outdated_project = mock.MagicMock()
-        self.outdated_project.name = "outdated_project"
-        self.outdated_project.relpath = "path/to/outdated_project"
-        self.outdated_project.Exists = True
-        self.outdated_project.gitdir = os.path.join(self.temp_dir, 'outdated_project', '.git')
+        # Stub outer client manifest; only repodir is read.
+        self.cmd.outer_client = types.SimpleNamespace(
+            manifest=types.SimpleNamespace(repodir=self.repo_dir)
+        )
 
-        self.uptodate_project = mock.MagicMock()
-        self.uptodate_project.name = "uptodate_project"
-        self.uptodate_project.relpath = "path/to/uptodate_project"
-        self.uptodate_project.Exists = True
-        self.uptodate_project.gitdir = os.path.join(self.temp_dir, 'uptodate_project', '.git')
+        # Plain-namespace projects with different states; existing
+        # projects carry the gitdir/CurrentBranch attributes that
+        # _IsProjectOutdated inspects.
+        self.new_project = types.SimpleNamespace(
+            name="new_project",
+            relpath="path/to/new_project",
+            Exists=False,
+        )
+        self.outdated_project = types.SimpleNamespace(
+            name="outdated_project",
+            relpath="path/to/outdated_project",
+            Exists=True,
+            gitdir=os.path.join(self.temp_dir, 'outdated_project', '.git'),
+            CurrentBranch="main",
+        )
+        self.uptodate_project = types.SimpleNamespace(
+            name="uptodate_project",
+            relpath="path/to/uptodate_project",
+            Exists=True,
+            gitdir=os.path.join(self.temp_dir, 'uptodate_project', '.git'),
+            CurrentBranch="main",
+        )
 
         self.all_projects = [self.new_project, self.outdated_project, self.uptodate_project]
 
-    def tearDown(self):
-        """Cleanup."""
-        shutil.rmtree(self.temp_dir)
+    def _load_cache(self, payload):
+        """Run _LoadCachedSelection against an in-memory cache payload.
+
+        The JSON decode and validation logic is what's under test, so
+        patch the exists/open pair and keep the bytes in RAM instead of
+        round-tripping them through the disk.
+        """
+        exists = mock.patch.object(os.path, "exists", return_value=True)
+        opener = mock.patch(
+            "builtins.open", mock.mock_open(read_data=payload)
+        )
+        with exists, opener:
+            return self.cmd._LoadCachedSelection(
+                "overlay_cache.json", self.all_projects
+            )
 
     def test_load_cached_selection_no_cache(self):
         """Test loading cached selection when no cache exists."""
-        cache_file = os.path.join(self.repo_dir, "overlay_cache.json")
-        result = self.cmd._LoadCachedSelection(cache_file, self.all_projects)
+        with mock.patch.object(os.path, "exists", return_value=False):
+            result = self.cmd._LoadCachedSelection(
+                "overlay_cache.json", self.all_projects
+            )
         self.assertIsNone(result)
 
     def test_save_and_load_cached_selection(self):
         """Test saving and loading cached project selection."""
-        cache_file = os.path.join(self.repo_dir, "overlay_cache.json")
+        cache_file = self._track(
+            os.path.join(self.repo_dir, "overlay_cache.json")
+        )
         project_names = ["new_project", "outdated_project"]
 
         # Save selection
@@ -397,32 +503,21 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
 
     def test_cached_selection_validates_against_manifest(self):
         """Test that cached selection validates projects against current manifest."""
-        cache_file = os.path.join(self.repo_dir, "overlay_cache.json")
-
-        # Save selection with a project that won't exist in current manifest
-        project_names = ["new_project", "nonexistent_project"]
-        self.cmd._SaveCachedSelection(cache_file, project_names)
-
-        # Load selection - should only return projects that exist in manifest
-        result = self.cmd._LoadCachedSelection(cache_file, self.all_projects)
-        self.assertEqual(result, {"new_project"})
+        # Seed a cache naming a project that won't exist in the current
+        # manifest; only the surviving name should come back.
+        payload = '{"timestamp": %d, "projects": ["new_project", "nonexistent_project"]}' % int(  # noqa: E501
+            time.time()
+        )
+        self.assertEqual(self._load_cache(payload), {"new_project"})
 
     def test_cached_selection_expires_after_7_days(self):
         """Test that cached selection expires after 7 days."""
-        cache_file = os.path.join(self.repo_dir, "overlay_cache.json")
-
-        # Create expired cache (older than 7 days)
-        expired_time = time.time() - (8 * 24 * 3600)  # 8 days ago
-        cache_data = {
-            'timestamp': expired_time,
-            'projects': ['new_project']
-        }
-
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
-
-        result = self.cmd._LoadCachedSelection(cache_file, self.all_projects)
-        self.assertIsNone(result)
+        # Seed an expired cache (older than 7 days).
+        expired_time = int(time.time()) - (8 * 24 * 3600)  # 8 days ago
+        payload = '{"timestamp": %d, "projects": ["new_project"]}' % (
+            expired_time
+        )
+        self.assertIsNone(self._load_cache(payload))
 
     def test_is_project_outdated_new_project(self):
         """Test project status detection for new projects."""
@@ -433,6 +528,7 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
         """Test project status detection when FETCH_HEAD is missing."""
         # Create gitdir but no FETCH_HEAD
         os.makedirs(self.outdated_project.gitdir, exist_ok=True)
+        self._track(self.outdated_project.gitdir)
 
         result = self.cmd._IsProjectOutdated(self.outdated_project)
         self.assertTrue(result)
@@ -441,13 +537,18 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
         """Test project status detection when FETCH_HEAD is stale."""
         # Create gitdir and stale FETCH_HEAD
         os.makedirs(self.outdated_project.gitdir, exist_ok=True)
-        fetch_head = os.path.join(self.outdated_project.gitdir, 'FETCH_HEAD')
+        self._track(self.outdated_project.gitdir)
+        fetch_head = self._track(
+            os.path.join(self.outdated_project.gitdir, 'FETCH_HEAD')
+        )
 
-        # Create file with old timestamp (more than 24 hours)
+        # Only st_mtime matters, so an empty file is enough; set the
+        # timestamp with the nanosecond variant to skip the float
+        # conversion in the utime path.
         old_time = time.time() - (25 * 3600)  # 25 hours ago
-        with open(fetch_head, 'w') as f:
-            f.write("dummy content")
-        os.utime(fetch_head, (old_time, old_time))
+        open(fetch_head, 'wb').close()
+        old_ns = int(old_time * 1e9)
+        os.utime(fetch_head, ns=(old_ns, old_ns))
 
         result = self.cmd._IsProjectOutdated(self.outdated_project)
         self.assertTrue(result)
@@ -456,10 +557,15 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
         """Test project status detection when FETCH_HEAD is recent."""
         # Create gitdir and recent FETCH_HEAD
         os.makedirs(self.uptodate_project.gitdir, exist_ok=True)
-        fetch_head = os.path.join(self.uptodate_project.gitdir, 'FETCH_HEAD')
+        self._track(self.uptodate_project.gitdir)
+        fetch_head = self._track(
+            os.path.join(self.uptodate_project.gitdir, 'FETCH_HEAD')
+        )
 
-        with open(fetch_head, 'w') as f:
-            f.write("dummy content")
+        # Stamp the file with the frozen "now" so it reads as recent.
+        open(fetch_head, 'wb').close()
+        now_ns = int(_FROZEN_TIME * 1e9)
+        os.utime(fetch_head, ns=(now_ns, now_ns))
 
         result = self.cmd._IsProjectOutdated(self.uptodate_project)
         self.assertFalse(result)
@@ -534,22 +640,19 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
             expected = [self.new_project, self.outdated_project]
             self.assertEqual(result, expected)
 
-    @mock.patch('builtins.input')
+    @mock.patch('builtins.input', side_effect=AssertionError("prompted"))
     def test_interactive_selection_auto_mode_bypass(self, mock_input):
-        """Test that auto mode bypasses interactive prompts."""
-        # Set auto mode
-        self.cmd._overlay_auto_mode = "new"
+        """Test that auto mode never reaches the interactive prompt.
 
-        # Mock the analysis methods
-        with mock.patch.object(self.cmd, '_IsProjectOutdated') as mock_outdated:
-            mock_outdated.side_effect = lambda p: p == self.outdated_project
+        The mode dispatch itself is covered by the _HandleAutoMode
+        tests; this only checks that input is never consulted.
+        """
+        self.cmd._overlay_auto_mode = "new"
 
-            result = self.cmd._InteractiveProjectSelection(self.all_projects)
+        result = self.cmd._InteractiveProjectSelection(self.all_projects)
 
-            # Should return only new projects without prompting
-            self.assertEqual(result, [self.new_project])
-            # Input should not be called in auto mode
-            mock_input.assert_not_called()
+        self.assertEqual(result, [self.new_project])
+        mock_input.assert_not_called()
 
     @mock.patch('builtins.input')
     def test_custom_project_selection_categories(self, mock_input):
@@ -588,65 +691,53 @@ class UseOverlayPerformanceFeatures(unittest.TestCase):
         self.assertEqual(result, [self.outdated_project])
 
 
-class UseOverlayAutomatedMode(unittest.TestCase):
+class UseOverlayAutomatedMode(OverlayTestCase):
     """Tests for --overlay-auto automated mode integration."""
 
     def setUp(self):
         """Common setup."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_dir = os.path.join(self.temp_dir, '.repo')
-        os.makedirs(self.repo_dir)
-
+        super().setUp()
         self.manifest = mock.MagicMock(repodir=self.repo_dir)
-        self.outer_client = mock.MagicMock()
-        self.outer_client.manifest.repodir = self.repo_dir
+        self.outer_client = types.SimpleNamespace(
+            manifest=types.SimpleNamespace(repodir=self.repo_dir)
+        )
 
         self.cmd = sync.Sync(manifest=self.manifest, outer_client=self.outer_client)
 
-        # Create mock projects
-        self.project1 = mock.MagicMock()
-        self.project1.name = "project1"
-        self.project1.relpath = "path/to/project1"
-        self.project1.Exists = False  # New project
-
-        self.project2 = mock.MagicMock()
-        self.project2.name = "project2"
-        self.project2.relpath = "path/to/project2"
-        self.project2.Exists = True  # Existing project
-        self.project2.gitdir = os.path.join(self.temp_dir, 'project2', '.git')
-
-    def tearDown(self):
-        """Cleanup."""
-        shutil.rmtree(self.temp_dir)
-
-    def test_overlay_auto_option_parsing(self):
-        """Test that --overlay-auto options are parsed correctly."""
-        test_cases = [
-            (["--use-overlay", "--overlay-auto=new"], "new"),
-            (["--use-overlay", "--overlay-auto=outdated"], "outdated"),
-            (["--use-overlay", "--overlay-auto=all"], "all"),
-            (["--use-overlay", "--overlay-auto=cached"], "cached"),
-        ]
-
-        for args, expected in test_cases:
-            opt, _ = self.cmd.OptionParser.parse_args(args)
-            self.assertEqual(opt.overlay_auto, expected)
+        # Plain-namespace projects (see UseOverlayInteractiveSelection).
+        self.project1 = types.SimpleNamespace(
+            name="project1",
+            relpath="path/to/project1",
+            Exists=False,  # New project
+        )
+        self.project2 = types.SimpleNamespace(
+            name="project2",
+            relpath="path/to/project2",
+            Exists=True,  # Existing project
+            gitdir=os.path.join(self.temp_dir, 'project2', '.git'),
+            CurrentBranch="main",
+        )
 
     def test_overlay_auto_invalid_option(self):
         """Test that invalid --overlay-auto options are rejected."""
         with self.assertRaises(SystemExit):
-            self.cmd.OptionParser.parse_args(["--use-overlay", "--overlay-auto=invalid"])
+            self._parser.parse_args(["--use-overlay", "--overlay-auto=invalid"])
 
-    @mock.patch('builtins.print')
-    def test_overlay_auto_mode_sets_attribute(self, mock_print):
-        """Test that overlay auto mode sets the correct attribute."""
+    def test_overlay_auto_mode_sets_attribute(self):
+        """Test that overlay auto mode sets the correct attribute.
+
+        The test doesn't assert on output, so the selection banner is
+        left to the runner's capture instead of patching print.
+        """
         # Mock GetProjects to avoid complex setup
         with mock.patch.object(self.cmd, 'GetProjects', return_value=[self.project1]):
             # Mock other dependencies
             with mock.patch.object(self.cmd, '_UpdateProjectsRevisionId'):
                 with mock.patch.object(self.cmd, '_IsProjectOutdated', return_value=False):
 
-                    opt, _ = self.cmd.OptionParser.parse_args(["--use-overlay", "--overlay-auto=new"])
+                    opt = _parse_default_opts(
+                        ["--use-overlay", "--overlay-auto=new"]
+                    )
 
                     # Mock the manifest project to avoid errors
                     mp = mock.MagicMock()
@@ -664,14 +755,39 @@ class UseOverlayAutomatedMode(unittest.TestCase):
                     self.assertEqual(result, [self.project1])  # New project selected
 
 
+# Frozen state payloads for LocalSyncState tests.  Kept as compact
+# module-level bytes so each seeding test reuses the same object instead
+# of rebuilding and re-encoding a string literal.
+_JSON_TWO_PROJECTS = b'{"projA":{"last_fetch":5},"projB":{"last_fetch":7}}'
+_JSON_PARTIAL_SYNC = (
+    b'{"projA":{"last_fetch":5,"last_checkout":5},'
+    b'"projB":{"last_fetch":5,"last_checkout":5}}'
+)
+
+
 class LocalSyncState(unittest.TestCase):
     """Tests for LocalSyncState."""
 
     _TIME = 10
 
+    @classmethod
+    def setUpClass(cls):
+        cls._class_tmp = tempfile.mkdtemp("LocalSyncState")
+        # This class always wants a deterministic clock; patch it once
+        # for the whole class instead of once per _new_state call.
+        cls._time_patcher = mock.patch("time.time", return_value=cls._TIME)
+        cls._time_mock = cls._time_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._time_patcher.stop()
+        shutil.rmtree(cls._class_tmp, ignore_errors=True)
+
     def setUp(self):
         """Common setup."""
-        self.topdir = tempfile.mkdtemp("LocalSyncState")
+        self.topdir = os.path.join(
+            self._class_tmp, self.id().rsplit(".", 1)[-1]
+        )
         self.repodir = os.path.join(self.topdir, ".repo")
         os.makedirs(self.repodir)
 
@@ -682,13 +798,18 @@ class LocalSyncState(unittest.TestCase):
         )
         self.state = self._new_state()
 
-    def tearDown(self):
-        """Common teardown."""
-        shutil.rmtree(self.topdir)
-
     def _new_state(self, time=_TIME):
-        with mock.patch("time.time", return_value=time):
-            return sync.LocalSyncState(self.manifest)
+        self._time_mock.return_value = time
+        return sync.LocalSyncState(self.manifest)
+
+    def _seed_state(self, data, time=_TIME):
+        """Construct state whose initial load reads data from memory.
+
+        Only the constructor's read is patched, so later Save calls
+        still hit the real per-test path.
+        """
+        with mock.patch("builtins.open", mock.mock_open(read_data=data)):
+            return self._new_state(time)
 
     def test_set(self):
         """Times are set."""
@@ -700,20 +821,10 @@ class LocalSyncState(unittest.TestCase):
 
     def test_update(self):
         """Times are updated."""
-        with open(self.state._path, "w") as f:
-            f.write(
-                """
-            {
-              "projB": {
-                "last_fetch": 5,
-                "last_checkout": 7
-              }
-            }
-            """
-            )
-
-        # Initialize state to read from the new file.
-        self.state = self._new_state()
+        # Initialize state from an in-memory payload.
+        self.state = self._seed_state(
+            '{"projB": {"last_fetch": 5, "last_checkout": 7}}'
+        )
         projA = mock.MagicMock(relpath="projA")
         projB = mock.MagicMock(relpath="projB")
         self.assertEqual(self.state.GetFetchTime(projA), None)
@@ -737,24 +848,8 @@ class LocalSyncState(unittest.TestCase):
 
     def test_partial_sync(self):
         """Partial sync state is detected."""
-        with open(self.state._path, "w") as f:
-            f.write(
-                """
-            {
-              "projA": {
-                "last_fetch": 5,
-                "last_checkout": 5
-              },
-              "projB": {
-                "last_fetch": 5,
-                "last_checkout": 5
-              }
-            }
-            """
-            )
-
-        # Initialize state to read from the new file.
-        self.state = self._new_state()
+        # Initialize state from an in-memory payload.
+        self.state = self._seed_state(_JSON_PARTIAL_SYNC)
         projB = mock.MagicMock(relpath="projB")
         self.assertEqual(self.state.IsPartiallySynced(), False)
 
@@ -787,19 +882,6 @@ class LocalSyncState(unittest.TestCase):
 
     def test_prune_removed_projects(self):
         """Removed projects are pruned."""
-        with open(self.state._path, "w") as f:
-            f.write(
-                """
-            {
-              "projA": {
-                "last_fetch": 5
-              },
-              "projB": {
-                "last_fetch": 7
-              }
-            }
-            """
-            )
 
         def mock_exists(path):
             if "projA" in path:
@@ -808,7 +890,7 @@ class LocalSyncState(unittest.TestCase):
 
         projA = mock.MagicMock(relpath="projA")
         projB = mock.MagicMock(relpath="projB")
-        self.state = self._new_state()
+        self.state = self._seed_state(_JSON_TWO_PROJECTS)
         self.assertEqual(self.state.GetFetchTime(projA), 5)
         self.assertEqual(self.state.GetFetchTime(projB), 7)
         with mock.patch("os.path.exists", side_effect=mock_exists):
@@ -821,19 +903,6 @@ class LocalSyncState(unittest.TestCase):
 
     def test_prune_removed_and_symlinked_projects(self):
         """Removed projects that still exists on disk as symlink are pruned."""
-        with open(self.state._path, "w") as f:
-            f.write(
-                """
-            {
-              "projA": {
-                "last_fetch": 5
-              },
-              "projB": {
-                "last_fetch": 7
-              }
-            }
-            """
-            )
 
         def mock_exists(path):
             return True
@@ -845,7 +914,7 @@ class LocalSyncState(unittest.TestCase):
 
         projA = mock.MagicMock(relpath="projA")
         projB = mock.MagicMock(relpath="projB")
-        self.state = self._new_state()
+        self.state = self._seed_state(_JSON_TWO_PROJECTS)
         self.assertEqual(self.state.GetFetchTime(projA), 5)
         self.assertEqual(self.state.GetFetchTime(projB), 7)
         with mock.patch("os.path.exists", side_effect=mock_exists):
@@ -858,7 +927,31 @@ class LocalSyncState(unittest.TestCase):
         self.assertEqual(self.state.GetFetchTime(projA), 5)
 
 
+# Shared stand-in for manifestProject.config.  Nothing asserts on it or
+# reads attributes off it — it is only handed to the (mocked) SyncBuffer
+# — so one empty-spec Mock serves every FakeProject.
+_CFG_STUB = mock.Mock(spec=[])
+
+
 class FakeProject:
+    # Freeze the attribute set: a typo'd attribute raises instead of
+    # silently landing in a fresh __dict__ slot, and instances in the
+    # ordering pools stay compact.  Sync_NetworkHalf/Sync_LocalHalf are
+    # assigned per-test by the worker tests.
+    __slots__ = (
+        "relpath",
+        "name",
+        "objdir",
+        "worktree",
+        "use_git_worktrees",
+        "UseAlternates",
+        "manifest",
+        "config",
+        "EnableRepositoryExtension",
+        "Sync_NetworkHalf",
+        "Sync_LocalHalf",
+    )
+
     def __init__(self, relpath, name=None, objdir=None):
         self.relpath = relpath
         self.name = name or relpath
@@ -867,10 +960,22 @@ class FakeProject:
 
         self.use_git_worktrees = False
         self.UseAlternates = False
-        self.manifest = mock.MagicMock()
-        self.manifest.GetProjectsWithName.return_value = [self]
-        self.config = mock.MagicMock()
-        self.EnableRepositoryExtension = mock.MagicMock()
+        # Plain namespace with just the attributes the sync paths read;
+        # MagicMock construction is far heavier and nothing asserts
+        # against these.
+        self.manifest = types.SimpleNamespace(
+            GetProjectsWithName=lambda *args, **kwargs: [self],
+            IsArchive=False,
+            CloneFilter=None,
+            PartialCloneExclude=None,
+            CloneFilterForDepth=None,
+            manifestProject=types.SimpleNamespace(config=_CFG_STUB),
+        )
+        self.config = types.SimpleNamespace(
+            GetBoolean=lambda key: False,
+            SetString=lambda *args, **kwargs: None,
+        )
+        self.EnableRepositoryExtension = lambda *args, **kwargs: None
 
     def RelPath(self, local=None):
         return self.relpath
@@ -883,43 +988,71 @@ class FakeProject:
 
 
 class SafeCheckoutOrder(unittest.TestCase):
-    def test_no_nested(self):
-        p_f = FakeProject("f")
-        p_foo = FakeProject("foo")
-        out = sync._SafeCheckoutOrder([p_f, p_foo])
-        self.assertEqual(out, [[p_f, p_foo]])
-
-    def test_basic_nested(self):
-        p_foo = p_foo = FakeProject("foo")
-        p_foo_bar = FakeProject("foo/bar")
-        out = sync._SafeCheckoutOrder([p_foo, p_foo_bar])
-        self.assertEqual(out, [[p_foo], [p_foo_bar]])
-
-    def test_complex_nested(self):
-        p_foo = FakeProject("foo")
-        p_foobar = FakeProject("foobar")
-        p_foo_dash_bar = FakeProject("foo-bar")
-        p_foo_bar = FakeProject("foo/bar")
-        p_foo_bar_baz_baq = FakeProject("foo/bar/baz/baq")
-        p_bar = FakeProject("bar")
-        out = sync._SafeCheckoutOrder(
-            [
-                p_foo_bar_baz_baq,
-                p_foo,
-                p_foobar,
-                p_foo_dash_bar,
-                p_foo_bar,
-                p_bar,
-            ]
-        )
-        self.assertEqual(
-            out,
-            [
-                [p_bar, p_foo, p_foo_dash_bar, p_foobar],
-                [p_foo_bar],
-                [p_foo_bar_baz_baq],
-            ],
-        )
+    @classmethod
+    def setUpClass(cls):
+        # One canonical project pool shared by every ordering case.
+        cls._projects = {
+            relpath: FakeProject(relpath)
+            for relpath in (
+                "f",
+                "foo",
+                "foobar",
+                "foo-bar",
+                "foo/bar",
+                "foo/bar/baz/baq",
+                "bar",
+            )
+        }
+
+    def test_orderings(self):
+        """Projects are batched so parents precede nested checkouts."""
+        cases = [
+            (
+                "no_nested",
+                ["f", "foo"],
+                [["f", "foo"]],
+            ),
+            (
+                "basic_nested",
+                ["foo", "foo/bar"],
+                [["foo"], ["foo/bar"]],
+            ),
+            (
+                "complex_nested",
+                [
+                    "foo/bar/baz/baq",
+                    "foo",
+                    "foobar",
+                    "foo-bar",
+                    "foo/bar",
+                    "bar",
+                ],
+                [
+                    ["bar", "foo", "foo-bar", "foobar"],
+                    ["foo/bar"],
+                    ["foo/bar/baz/baq"],
+                ],
+            ),
+        ]
+        p = self._projects
+        for name, inputs, expected in cases:
+            with self.subTest(name=name):
+                out = sync._SafeCheckoutOrder([p[r] for r in inputs])
+                self.assertEqual(
+                    out, [[p[r] for r in batch] for batch in expected]
+                )
+
+    def test_fastpath_no_slashes(self):
+        """Flat manifests come back as a single sorted batch."""
+        for size in (1, 10, 100, 1000):
+            with self.subTest(size=size):
+                projects = [
+                    FakeProject(f"proj{i:04}") for i in range(size - 1, -1, -1)
+                ]
+                out = sync._SafeCheckoutOrder(projects)
+                self.assertEqual(
+                    out, [sorted(projects, key=lambda x: x.relpath)]
+                )
 
 
 class Chunksize(unittest.TestCase):
@@ -952,8 +1085,19 @@ class GetPreciousObjectsState(unittest.TestCase):
     def setUp(self):
         """Common setup."""
         self.cmd = sync.Sync()
+        # Pin the attribute surface like the opt mock below; stray reads
+        # raise instead of allocating child mocks.  Project sets these in
+        # __init__, so the names are listed explicitly rather than
+        # spec'ing the class itself.
         self.project = p = mock.MagicMock(
-            use_git_worktrees=False, UseAlternates=False
+            spec_set=[
+                "use_git_worktrees",
+                "UseAlternates",
+                "name",
+                "manifest",
+            ],
+            use_git_worktrees=False,
+            UseAlternates=False,
         )
         p.manifest.GetProjectsWithName.return_value = [p]
 
@@ -1002,12 +1146,54 @@ class GetPreciousObjectsState(unittest.TestCase):
         )
 
 
+# Option defaults shared by the Execute-path tests, applied on top of
+# whatever parse_args produced.
+_DEFAULT_OPT_OVERRIDES = {
+    "clone_bundle": False,
+    "jobs": 4,
+    "quiet": True,
+    "use_superproject": False,
+    "current_branch_only": True,
+    "optimized_fetch": True,
+    "retry_fetches": 1,
+    "prune": False,
+    "auto_gc": False,
+    "repo_verify": False,
+}
+
+
+def _default_sync_opts(extra_argv=(), **overrides):
+    """Parse sync options once and apply the shared Execute defaults."""
+    opt = _parse_default_opts(extra_argv)
+    for key, value in _DEFAULT_OPT_OVERRIDES.items():
+        setattr(opt, key, value)
+    for key, value in overrides.items():
+        setattr(opt, key, value)
+    return opt
+
+
 class SyncCommand(unittest.TestCase):
     """Tests for cmd.Execute."""
 
+    # Fixed timestamp from the frozen test clock; no per-test syscall.
+    _NOW = _FROZEN_TIME
+
+    @classmethod
+    def setUpClass(cls):
+        cls._class_tmp = tempfile.mkdtemp(cls.__name__)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._class_tmp, ignore_errors=True)
+
     def setUp(self):
         """Common setup."""
-        self.repodir = tempfile.mkdtemp(".repo")
+        # Per-test subdir under one class-scoped root; a single rmtree
+        # in tearDownClass replaces the per-test mkdtemp/rmtree pair.
+        self.repodir = os.path.join(
+            self._class_tmp, self.id().rsplit(".", 1)[-1] + ".repo"
+        )
+        os.makedirs(self.repodir)
         self.manifest = manifest = mock.MagicMock(
             repodir=self.repodir,
         )
@@ -1016,7 +1202,7 @@ class SyncCommand(unittest.TestCase):
         self.outer_client = outer_client = mock.MagicMock()
         outer_client.manifest.IsArchive = True
         manifest.manifestProject.worktree = "worktree_path/"
-        manifest.repoProject.LastFetch = time.time()
+        manifest.repoProject.LastFetch = self._NOW
         self.sync_network_half_error = None
         self.sync_local_half_error = None
         self.cmd = sync.Sync(
@@ -1042,28 +1228,19 @@ class SyncCommand(unittest.TestCase):
         )
         p.manifest.GetProjectsWithName.return_value = [p]
 
-        mock.patch.object(
-            sync,
-            "_PostRepoFetch",
-            return_value=None,
-        ).start()
-
-        mock.patch.object(
-            self.cmd, "GetProjects", return_value=[self.project]
-        ).start()
+        # Enter all the setup patches through one stack, torn down with
+        # a single close instead of one stop per patcher.
+        self._stack = contextlib.ExitStack()
+        self.addCleanup(self._stack.close)
+        for patcher in (
+            mock.patch.object(sync, "_PostRepoFetch", return_value=None),
+            mock.patch.object(
+                self.cmd, "GetProjects", return_value=[self.project]
+            ),
+        ):
+            self._stack.enter_context(patcher)
 
-        opt, _ = self.cmd.OptionParser.parse_args([])
-        opt.clone_bundle = False
-        opt.jobs = 4
-        opt.quiet = True
-        opt.use_superproject = False
-        opt.current_branch_only = True
-        opt.optimized_fetch = True
-        opt.retry_fetches = 1
-        opt.prune = False
-        opt.auto_gc = False
-        opt.repo_verify = False
-        self.opt = opt
+        self.opt = _default_sync_opts()
 
     def tearDown(self):
         mock.patch.stopall()
@@ -1084,38 +1261,37 @@ class SyncCommand(unittest.TestCase):
     @mock.patch('builtins.input')
     def test_use_overlay_triggers_interactive_selection(self, mock_input):
         """Test that --use-overlay triggers interactive project selection."""
-        # Set up option with use_overlay enabled
-        opt, _ = self.cmd.OptionParser.parse_args(["--use-overlay"])
-        opt.clone_bundle = False
-        opt.jobs = 4
-        opt.quiet = True
-        opt.use_superproject = False
-        opt.current_branch_only = True
-        opt.optimized_fetch = True
-        opt.retry_fetches = 1
-        opt.prune = False
-        opt.auto_gc = False
-        opt.repo_verify = False
-        opt.local_only = True  # Set to local only to avoid network operations
-        opt.this_manifest_only = True
+        # Set up option with use_overlay enabled; local only to avoid
+        # network operations.
+        opt = _default_sync_opts(
+            ["--use-overlay"], local_only=True, this_manifest_only=True
+        )
 
         # Mock input to select "all" projects
         mock_input.return_value = "all"
 
-        # Mock _InteractiveProjectSelection to track if it's called
-        with mock.patch.object(self.cmd, '_InteractiveProjectSelection') as mock_selection:
-            mock_selection.return_value = [self.project]
-
-            # Mock other methods to prevent actual sync operations
-            with mock.patch.object(self.cmd, '_UpdateRepoProject'):
-                with mock.patch.object(self.cmd, '_UpdateProjectsRevisionId'):
-                    with mock.patch.object(self.cmd, '_UpdateAllManifestProjects'):
-                        with mock.patch.object(sync, '_PostRepoUpgrade'):
-                            try:
-                                self.cmd.Execute(opt, [])
-                            except:
-                                # Expected to fail due to mocking, but we care about selection call
-                                pass
+        # Mock _InteractiveProjectSelection to track if it's called,
+        # plus the methods that would perform actual sync operations;
+        # one stack enters them all in a single pass.
+        with contextlib.ExitStack() as stack:
+            mock_selection = stack.enter_context(
+                mock.patch.object(
+                    self.cmd,
+                    '_InteractiveProjectSelection',
+                    return_value=[self.project],
+                )
+            )
+            for method in (
+                '_UpdateRepoProject',
+                '_UpdateProjectsRevisionId',
+                '_UpdateAllManifestProjects',
+            ):
+                stack.enter_context(mock.patch.object(self.cmd, method))
+            stack.enter_context(mock.patch.object(sync, '_PostRepoUpgrade'))
+            # Execute trips over the thin option stub shortly after the
+            # selection fires and surfaces it as a RepoExitError.
+            with self.assertRaises(RepoExitError):
+                self.cmd.Execute(opt, [])
 
             # Verify that interactive selection was called
             mock_selection.assert_called_once()
@@ -1123,19 +1299,7 @@ class SyncCommand(unittest.TestCase):
     def test_use_overlay_disabled_no_interactive_selection(self):
         """Test that without --use-overlay, interactive selection is not triggered."""
         # Set up option without use_overlay
-        opt, _ = self.cmd.OptionParser.parse_args([])
-        opt.clone_bundle = False
-        opt.jobs = 4
-        opt.quiet = True
-        opt.use_superproject = False
-        opt.current_branch_only = True
-        opt.optimized_fetch = True
-        opt.retry_fetches = 1
-        opt.prune = False
-        opt.auto_gc = False
-        opt.repo_verify = False
-        opt.local_only = True
-        opt.this_manifest_only = True
+        opt = _default_sync_opts(local_only=True, this_manifest_only=True)
 
         # Mock _InteractiveProjectSelection to track if it's called
         with mock.patch.object(self.cmd, '_InteractiveProjectSelection') as mock_selection:
@@ -1144,63 +1308,72 @@ class SyncCommand(unittest.TestCase):
                 with mock.patch.object(self.cmd, '_UpdateProjectsRevisionId'):
                     with mock.patch.object(self.cmd, '_UpdateAllManifestProjects'):
                         with mock.patch.object(sync, '_PostRepoUpgrade'):
-                            try:
+                            with self.assertRaises(RepoExitError):
                                 self.cmd.Execute(opt, [])
-                            except:
-                                # Expected to fail due to mocking, but we care about selection call
-                                pass
 
             # Verify that interactive selection was NOT called
             mock_selection.assert_not_called()
 
-    @mock.patch('builtins.print')
-    def test_use_overlay_auto_mode_integration(self, mock_print):
-        """Test that --overlay-auto modes are properly integrated."""
-        # Test different auto modes
-        auto_modes = ["new", "outdated", "all", "cached"]
-
-        for mode in auto_modes:
-            with self.subTest(mode=mode):
-                # Set up option with auto mode
-                opt, _ = self.cmd.OptionParser.parse_args(["--use-overlay", f"--overlay-auto={mode}"])
-                opt.clone_bundle = False
-                opt.jobs = 4
-                opt.quiet = True
-                opt.use_superproject = False
-                opt.current_branch_only = True
-                opt.optimized_fetch = True
-                opt.retry_fetches = 1
-                opt.prune = False
-                opt.auto_gc = False
-                opt.repo_verify = False
-                opt.local_only = True
-                opt.this_manifest_only = True
-
-                # Mock _InteractiveProjectSelection to check auto mode is set
-                def mock_selection(projects):
-                    # Verify that auto mode is properly set
-                    self.assertEqual(self.cmd._overlay_auto_mode, mode)
-                    return [self.project]  # Return some projects
-
-                with mock.patch.object(self.cmd, '_InteractiveProjectSelection', side_effect=mock_selection) as mock_selection_method:
-                    # Mock other methods to prevent actual sync operations
-                    with mock.patch.object(self.cmd, '_UpdateRepoProject'):
-                        with mock.patch.object(self.cmd, '_UpdateProjectsRevisionId'):
-                            with mock.patch.object(self.cmd, '_UpdateAllManifestProjects'):
-                                with mock.patch.object(sync, '_PostRepoUpgrade'):
-                                    try:
-                                        self.cmd.Execute(opt, [])
-                                    except:
-                                        # Expected to fail due to mocking, but we care about auto mode
-                                        pass
-
-                    # Verify that interactive selection was called with auto mode set
-                    mock_selection_method.assert_called_once()
+    def _run_auto_mode(self, mode):
+        """Run Execute with --overlay-auto=mode and check the plumbing."""
+        opt = _default_sync_opts(
+            ["--use-overlay"], local_only=True, this_manifest_only=True
+        )
+        opt.overlay_auto = mode
+
+        # Mock _InteractiveProjectSelection to check auto mode is set
+        def mock_selection(projects):
+            # Verify that auto mode is properly set
+            self.assertEqual(self.cmd._overlay_auto_mode, mode)
+            return [self.project]  # Return some projects
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock.patch('builtins.print'))
+            mock_selection_method = stack.enter_context(
+                mock.patch.object(
+                    self.cmd,
+                    '_InteractiveProjectSelection',
+                    side_effect=mock_selection,
+                )
+            )
+            # Mock other methods to prevent actual sync operations
+            for method in (
+                '_UpdateRepoProject',
+                '_UpdateProjectsRevisionId',
+                '_UpdateAllManifestProjects',
+            ):
+                stack.enter_context(mock.patch.object(self.cmd, method))
+            stack.enter_context(mock.patch.object(sync, '_PostRepoUpgrade'))
+            # Execute trips over the thin option stub right after the
+            # selection fires.
+            with self.assertRaises(RepoExitError):
+                self.cmd.Execute(opt, [])
+
+            # Verify that interactive selection was called with auto mode set
+            mock_selection_method.assert_called_once()
+
+    # One method per mode so runners can schedule and report each mode
+    # independently.
+    def test_use_overlay_auto_mode_new(self):
+        """Test that --overlay-auto=new is properly integrated."""
+        self._run_auto_mode("new")
+
+    def test_use_overlay_auto_mode_outdated(self):
+        """Test that --overlay-auto=outdated is properly integrated."""
+        self._run_auto_mode("outdated")
+
+    def test_use_overlay_auto_mode_all(self):
+        """Test that --overlay-auto=all is properly integrated."""
+        self._run_auto_mode("all")
+
+    def test_use_overlay_auto_mode_cached(self):
+        """Test that --overlay-auto=cached is properly integrated."""
+        self._run_auto_mode("cached")
 
     def test_overlay_auto_requires_use_overlay(self):
         """Test that --overlay-auto requires --use-overlay to be effective."""
         # Parse options with overlay-auto but without use-overlay
-        opt, _ = self.cmd.OptionParser.parse_args(["--overlay-auto=new"])
+        opt = _parse_default_opts(["--overlay-auto=new"])
 
         # use_overlay should be False
         self.assertFalse(opt.use_overlay)
@@ -1214,15 +1387,28 @@ class SyncCommand(unittest.TestCase):
 class SyncUpdateRepoProject(unittest.TestCase):
     """Tests for Sync._UpdateRepoProject."""
 
+    # Fixed timestamps from the frozen test clock.
+    _NOW = _FROZEN_TIME
+    _STALE = _NOW - sync._ONE_DAY_S - 1
+
+    @classmethod
+    def setUpClass(cls):
+        cls._class_tmp = tempfile.mkdtemp(cls.__name__)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._class_tmp, ignore_errors=True)
+
     def setUp(self):
         """Common setup."""
-        self.repodir = tempfile.mkdtemp(".repo")
+        self.repodir = os.path.join(
+            self._class_tmp, self.id().rsplit(".", 1)[-1] + ".repo"
+        )
+        os.makedirs(self.repodir)
         self.manifest = manifest = mock.MagicMock(repodir=self.repodir)
         # Create a repoProject with a mock Sync_NetworkHalf.
         repoProject = mock.MagicMock(name="repo")
-        repoProject.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(True, None)
-        )
+        repoProject.Sync_NetworkHalf = mock.Mock(return_value=_OK_FETCH)
         manifest.repoProject = repoProject
         manifest.IsArchive = False
         manifest.CloneFilter = None
@@ -1232,7 +1418,7 @@ class SyncUpdateRepoProject(unittest.TestCase):
         git_event_log = mock.MagicMock(ErrorEvent=mock.Mock(return_value=None))
         self.cmd = sync.Sync(manifest=manifest, git_event_log=git_event_log)
 
-        opt, _ = self.cmd.OptionParser.parse_args([])
+        opt = _parse_default_opts()
         opt.local_only = False
         opt.repo_verify = False
         opt.verbose = False
@@ -1249,14 +1435,11 @@ class SyncUpdateRepoProject(unittest.TestCase):
         mock.patch.object(sync.Sync, "_GetCurrentBranchOnly").start()
 
     def tearDown(self):
-        shutil.rmtree(self.repodir)
         mock.patch.stopall()
 
     def test_fetches_when_stale(self):
         """Test it fetches when the repo project is stale."""
-        self.manifest.repoProject.LastFetch = time.time() - (
-            sync._ONE_DAY_S + 1
-        )
+        self.manifest.repoProject.LastFetch = self._STALE
 
         with mock.patch.object(sync, "_PostRepoFetch") as mock_post_fetch:
             self.cmd._UpdateRepoProject(self.opt, self.manifest, self.errors)
@@ -1266,7 +1449,7 @@ class SyncUpdateRepoProject(unittest.TestCase):
 
     def test_skips_when_fresh(self):
         """Test it skips fetch when repo project is fresh."""
-        self.manifest.repoProject.LastFetch = time.time()
+        self.manifest.repoProject.LastFetch = self._NOW
 
         with mock.patch.object(sync, "_PostRepoFetch") as mock_post_fetch:
             self.cmd._UpdateRepoProject(self.opt, self.manifest, self.errors)
@@ -1276,9 +1459,7 @@ class SyncUpdateRepoProject(unittest.TestCase):
     def test_skips_local_only(self):
         """Test it does nothing with --local-only."""
         self.opt.local_only = True
-        self.manifest.repoProject.LastFetch = time.time() - (
-            sync._ONE_DAY_S + 1
-        )
+        self.manifest.repoProject.LastFetch = self._STALE
 
         with mock.patch.object(sync, "_PostRepoFetch") as mock_post_fetch:
             self.cmd._UpdateRepoProject(self.opt, self.manifest, self.errors)
@@ -1287,7 +1468,7 @@ class SyncUpdateRepoProject(unittest.TestCase):
 
     def test_post_repo_fetch_skipped_on_env_var(self):
         """Test _PostRepoFetch is skipped when REPO_SKIP_SELF_UPDATE is set."""
-        self.manifest.repoProject.LastFetch = time.time()
+        self.manifest.repoProject.LastFetch = self._NOW
 
         with mock.patch.dict(os.environ, {"REPO_SKIP_SELF_UPDATE": "1"}):
             with mock.patch.object(sync, "_PostRepoFetch") as mock_post_fetch:
@@ -1298,9 +1479,7 @@ class SyncUpdateRepoProject(unittest.TestCase):
 
     def test_fetch_failure_is_handled(self):
         """Test that a fetch failure is recorded and doesn't crash."""
-        self.manifest.repoProject.LastFetch = time.time() - (
-            sync._ONE_DAY_S + 1
-        )
+        self.manifest.repoProject.LastFetch = self._STALE
         fetch_error = GitError("Fetch failed")
         self.manifest.repoProject.Sync_NetworkHalf.return_value = (
             SyncNetworkHalfResult(False, fetch_error)
@@ -1316,11 +1495,62 @@ class SyncUpdateRepoProject(unittest.TestCase):
 class InterleavedSyncTest(unittest.TestCase):
     """Tests for interleaved sync."""
 
+    # Fixed timestamp from the frozen test clock.
+    _NOW = _FROZEN_TIME
+
+    @classmethod
+    def setUpClass(cls):
+        cls._class_tmp = tempfile.mkdtemp(cls.__name__)
+        # Swap in the parallel-context mock for the whole class.  The
+        # attribute is replaced directly rather than via a started
+        # patcher because tearDown's mock.patch.stopall would stop a
+        # class-scoped patcher after the first test.
+        cls._real_get_parallel_context = sync.Sync.get_parallel_context
+        cls._shared_sync_dict = {}
+        cls._shared_context = {
+            "projects": [],
+            "sync_dict": cls._shared_sync_dict,
+        }
+        cls._shared_get_parallel_context = mock.MagicMock(
+            return_value=cls._shared_context
+        )
+        sync.Sync.get_parallel_context = cls._shared_get_parallel_context
+        # Same direct-swap treatment for SyncBuffer: installed once for
+        # the class, reset per test in setUp.
+        cls._real_sync_buffer = sync.SyncBuffer
+        cls._sync_buffer_mock = mock.MagicMock()
+        sync.SyncBuffer = cls._sync_buffer_mock
+
+        # Baseline worker options, parsed once for the class; _get_opts
+        # hands out shallow copies with only the differing flags
+        # overlaid.
+        cls._base_opts, _ = _CACHED_PARSER.parse_args(["--interleaved"])
+        cls._base_opts.quiet = True
+        cls._base_opts.verbose = False
+        cls._base_opts.force_sync = False
+        cls._base_opts.clone_bundle = False
+        cls._base_opts.tags = False
+        cls._base_opts.optimized_fetch = False
+        cls._base_opts.retry_fetches = 0
+        cls._base_opts.prune = False
+        cls._base_opts.detach_head = False
+        cls._base_opts.force_checkout = False
+        cls._base_opts.rebase = False
+
+    @classmethod
+    def tearDownClass(cls):
+        sync.Sync.get_parallel_context = cls._real_get_parallel_context
+        sync.SyncBuffer = cls._real_sync_buffer
+        shutil.rmtree(cls._class_tmp, ignore_errors=True)
+
     def setUp(self):
         """Set up a sync command with mocks."""
-        self.repodir = tempfile.mkdtemp(".repo")
+        self.repodir = os.path.join(
+            self._class_tmp, self.id().rsplit(".", 1)[-1] + ".repo"
+        )
+        os.makedirs(self.repodir)
         self.manifest = mock.MagicMock(repodir=self.repodir)
-        self.manifest.repoProject.LastFetch = time.time()
+        self.manifest.repoProject.LastFetch = self._NOW
         self.manifest.repoProject.worktree = self.repodir
         self.manifest.manifestProject.worktree = self.repodir
         self.manifest.IsArchive = False
@@ -1342,36 +1572,45 @@ class InterleavedSyncTest(unittest.TestCase):
         )
         self.projC = FakeProject("projC", objdir="objC")
 
-        # Mock methods that are not part of the core interleaved sync logic.
-        mock.patch.object(self.cmd, "_UpdateAllManifestProjects").start()
-        mock.patch.object(self.cmd, "_UpdateProjectsRevisionId").start()
-        mock.patch.object(self.cmd, "_ValidateOptionsWithManifest").start()
-        mock.patch.object(sync, "_PostRepoUpgrade").start()
-        mock.patch.object(sync, "_PostRepoFetch").start()
-
-        # Mock parallel context for worker tests.
-        self.parallel_context_patcher = mock.patch(
-            "subcmds.sync.Sync.get_parallel_context"
-        )
-        self.mock_get_parallel_context = self.parallel_context_patcher.start()
-        self.sync_dict = {}
-        self.mock_context = {
-            "projects": [],
-            "sync_dict": self.sync_dict,
-        }
-        self.mock_get_parallel_context.return_value = self.mock_context
-
-        # Mock _GetCurrentBranchOnly for worker tests.
-        mock.patch.object(sync.Sync, "_GetCurrentBranchOnly").start()
+        # Mock methods that are not part of the core interleaved sync
+        # logic, entered through one stack so teardown is a single
+        # close.  _GetCurrentBranchOnly is for the worker tests.
+        self._stack = contextlib.ExitStack()
+        self.addCleanup(self._stack.close)
+        for patcher in (
+            mock.patch.object(self.cmd, "_UpdateAllManifestProjects"),
+            mock.patch.object(self.cmd, "_UpdateProjectsRevisionId"),
+            mock.patch.object(self.cmd, "_ValidateOptionsWithManifest"),
+            mock.patch.object(sync, "_PostRepoUpgrade"),
+            mock.patch.object(sync, "_PostRepoFetch"),
+            mock.patch.object(sync.Sync, "_GetCurrentBranchOnly"),
+        ):
+            self._stack.enter_context(patcher)
+
+        # Shared parallel context for worker tests; only the mutable
+        # fields are reset between tests.
+        self.mock_get_parallel_context = self._shared_get_parallel_context
+        self.mock_get_parallel_context.return_value = self._shared_context
+        self.sync_dict = self._shared_sync_dict
+        self.sync_dict.clear()
+        self.mock_context = self._shared_context
+        self.mock_context["projects"] = []
+        self._sync_buffer_mock.reset_mock()
+        self._sync_buffer_mock.return_value.Finish.return_value = True
 
     def tearDown(self):
         """Clean up resources."""
-        shutil.rmtree(self.repodir)
         mock.patch.stopall()
 
+    def _patch_get_projects(self, projects):
+        """Patch GetProjects through the setUp stack; one teardown call."""
+        self._stack.enter_context(
+            mock.patch.object(self.cmd, "GetProjects", return_value=projects)
+        )
+
     def test_interleaved_fail_fast(self):
         """Test that --fail-fast is respected in interleaved mode."""
-        opt, args = self.cmd.OptionParser.parse_args(
+        opt, args = _CACHED_PARSER.parse_args(
             ["--interleaved", "--fail-fast", "-j2"]
         )
         opt.quiet = True
@@ -1381,9 +1620,7 @@ class InterleavedSyncTest(unittest.TestCase):
         # 2. [projA/sub]
         # We want to fail on the first batch and ensure the second isn't run.
         all_projects = [self.projA, self.projB, self.projA_sub]
-        mock.patch.object(
-            self.cmd, "GetProjects", return_value=all_projects
-        ).start()
+        self._patch_get_projects(all_projects)
 
         # Mock ExecuteInParallel to simulate a failed run on the first batch of
         # projects.
@@ -1406,7 +1643,7 @@ class InterleavedSyncTest(unittest.TestCase):
 
     def test_interleaved_shared_objdir_serial(self):
         """Test that projects with shared objdir are processed serially."""
-        opt, args = self.cmd.OptionParser.parse_args(["--interleaved", "-j4"])
+        opt, args = _CACHED_PARSER.parse_args(["--interleaved", "-j4"])
         opt.quiet = True
 
         # Setup projects with a shared objdir.
@@ -1414,20 +1651,19 @@ class InterleavedSyncTest(unittest.TestCase):
         self.projC.objdir = "common_objdir"
 
         all_projects = [self.projA, self.projB, self.projC]
-        mock.patch.object(
-            self.cmd, "GetProjects", return_value=all_projects
-        ).start()
+        self._patch_get_projects(all_projects)
 
         def execute_side_effect(jobs, target, work_items, **kwargs):
             # The callback is a partial object. The first arg is the set we
             # need to update to avoid the stall detection.
             synced_relpaths_set = kwargs["callback"].args[0]
             projects_in_pass = self.cmd.get_parallel_context()["projects"]
-            for item in work_items:
-                for project_idx in item:
-                    synced_relpaths_set.add(
-                        projects_in_pass[project_idx].relpath
-                    )
+            # One relpath resolution per project, then a single bulk
+            # update instead of a per-index add loop.
+            relpaths = [p.relpath for p in projects_in_pass]
+            synced_relpaths_set.update(
+                relpaths[i] for item in work_items for i in item
+            )
             return True
 
         execute_mock = mock.patch.object(
@@ -1451,171 +1687,116 @@ class InterleavedSyncTest(unittest.TestCase):
         expected_sets = {frozenset([0, 2]), frozenset([1])}
         self.assertEqual(work_items_sets, expected_sets)
 
-    def _get_opts(self, args=None):
+    def _get_opts(self, **overrides):
         """Helper to get default options for worker tests."""
-        if args is None:
-            args = ["--interleaved"]
-        opt, _ = self.cmd.OptionParser.parse_args(args)
-        # Set defaults for options used by the worker.
-        opt.quiet = True
-        opt.verbose = False
-        opt.force_sync = False
-        opt.clone_bundle = False
-        opt.tags = False
-        opt.optimized_fetch = False
-        opt.retry_fetches = 0
-        opt.prune = False
-        opt.detach_head = False
-        opt.force_checkout = False
-        opt.rebase = False
+        opt = copy.copy(self._base_opts)
+        for key, value in overrides.items():
+            setattr(opt, key, value)
         return opt
 
-    def test_worker_successful_sync(self):
-        """Test _SyncProjectList with a successful fetch and checkout."""
-        opt = self._get_opts()
+    def _run_worker(
+        self,
+        *,
+        fetch_result=None,
+        fetch_side_effect=None,
+        checkout_side_effect=None,
+        worktree="projA",
+        **opt_overrides,
+    ):
+        """Run _SyncProjectList against projA and return its result.
+
+        The shared boilerplate (options, project mocks, parallel
+        context) lives here; tests vary only the interesting inputs.
+        """
+        opt = self._get_opts(**opt_overrides)
         project = self.projA
+        project.worktree = worktree
         project.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(error=None, remote_fetched=True)
+            return_value=fetch_result, side_effect=fetch_side_effect
         )
-        project.Sync_LocalHalf = mock.Mock()
-        project.manifest.manifestProject.config = mock.MagicMock()
+        project.Sync_LocalHalf = mock.Mock(side_effect=checkout_side_effect)
         self.mock_context["projects"] = [project]
 
-        with mock.patch("subcmds.sync.SyncBuffer") as mock_sync_buffer:
-            mock_sync_buf_instance = mock.MagicMock()
-            mock_sync_buf_instance.Finish.return_value = True
-            mock_sync_buffer.return_value = mock_sync_buf_instance
+        result_obj = self.cmd._SyncProjectList(opt, [0])
 
-            result_obj = self.cmd._SyncProjectList(opt, [0])
+        self.assertEqual(len(result_obj.results), 1)
+        return result_obj.results[0]
 
-            self.assertEqual(len(result_obj.results), 1)
-            result = result_obj.results[0]
-            self.assertTrue(result.fetch_success)
-            self.assertTrue(result.checkout_success)
-            self.assertIsNone(result.fetch_error)
-            self.assertIsNone(result.checkout_error)
-            project.Sync_NetworkHalf.assert_called_once()
-            project.Sync_LocalHalf.assert_called_once()
+    def test_worker_successful_sync(self):
+        """Test _SyncProjectList with a successful fetch and checkout."""
+        result = self._run_worker(fetch_result=_OK_FETCH)
+
+        self.assertTrue(result.fetch_success)
+        self.assertTrue(result.checkout_success)
+        self.assertIsNone(result.fetch_error)
+        self.assertIsNone(result.checkout_error)
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_called_once()
 
     def test_worker_fetch_fails(self):
         """Test _SyncProjectList with a failed fetch."""
-        opt = self._get_opts()
-        project = self.projA
         fetch_error = GitError("Fetch failed")
-        project.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(
+        result = self._run_worker(
+            fetch_result=SyncNetworkHalfResult(
                 error=fetch_error, remote_fetched=False
             )
         )
-        project.Sync_LocalHalf = mock.Mock()
-        self.mock_context["projects"] = [project]
-
-        result_obj = self.cmd._SyncProjectList(opt, [0])
-        result = result_obj.results[0]
 
         self.assertFalse(result.fetch_success)
         self.assertFalse(result.checkout_success)
         self.assertEqual(result.fetch_error, fetch_error)
         self.assertIsNone(result.checkout_error)
-        project.Sync_NetworkHalf.assert_called_once()
-        project.Sync_LocalHalf.assert_not_called()
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_not_called()
 
     def test_worker_no_worktree(self):
         """Test interleaved sync does not checkout with no worktree."""
-        opt = self._get_opts()
-        project = self.projA
-        project.worktree = None
-        project.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(error=None, remote_fetched=True)
-        )
-        project.Sync_LocalHalf = mock.Mock()
-        self.mock_context["projects"] = [project]
-
-        result_obj = self.cmd._SyncProjectList(opt, [0])
-        result = result_obj.results[0]
+        result = self._run_worker(fetch_result=_OK_FETCH, worktree=None)
 
         self.assertTrue(result.fetch_success)
         self.assertTrue(result.checkout_success)
-        project.Sync_NetworkHalf.assert_called_once()
-        project.Sync_LocalHalf.assert_not_called()
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_not_called()
 
     def test_worker_fetch_fails_exception(self):
         """Test _SyncProjectList with an exception during fetch."""
-        opt = self._get_opts()
-        project = self.projA
         fetch_error = GitError("Fetch failed")
-        project.Sync_NetworkHalf = mock.Mock(side_effect=fetch_error)
-        project.Sync_LocalHalf = mock.Mock()
-        self.mock_context["projects"] = [project]
-
-        result_obj = self.cmd._SyncProjectList(opt, [0])
-        result = result_obj.results[0]
+        result = self._run_worker(fetch_side_effect=fetch_error)
 
         self.assertFalse(result.fetch_success)
         self.assertFalse(result.checkout_success)
         self.assertEqual(result.fetch_error, fetch_error)
-        project.Sync_NetworkHalf.assert_called_once()
-        project.Sync_LocalHalf.assert_not_called()
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_not_called()
 
     def test_worker_checkout_fails(self):
         """Test _SyncProjectList with an exception during checkout."""
-        opt = self._get_opts()
-        project = self.projA
-        project.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(error=None, remote_fetched=True)
-        )
         checkout_error = GitError("Checkout failed")
-        project.Sync_LocalHalf = mock.Mock(side_effect=checkout_error)
-        project.manifest.manifestProject.config = mock.MagicMock()
-        self.mock_context["projects"] = [project]
-
-        with mock.patch("subcmds.sync.SyncBuffer"):
-            result_obj = self.cmd._SyncProjectList(opt, [0])
-            result = result_obj.results[0]
+        result = self._run_worker(
+            fetch_result=_OK_FETCH, checkout_side_effect=checkout_error
+        )
 
-            self.assertTrue(result.fetch_success)
-            self.assertFalse(result.checkout_success)
-            self.assertIsNone(result.fetch_error)
-            self.assertEqual(result.checkout_error, checkout_error)
-            project.Sync_NetworkHalf.assert_called_once()
-            project.Sync_LocalHalf.assert_called_once()
+        self.assertTrue(result.fetch_success)
+        self.assertFalse(result.checkout_success)
+        self.assertIsNone(result.fetch_error)
+        self.assertEqual(result.checkout_error, checkout_error)
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_called_once()
 
     def test_worker_local_only(self):
         """Test _SyncProjectList with --local-only."""
-        opt = self._get_opts(["--interleaved", "--local-only"])
-        project = self.projA
-        project.Sync_NetworkHalf = mock.Mock()
-        project.Sync_LocalHalf = mock.Mock()
-        project.manifest.manifestProject.config = mock.MagicMock()
-        self.mock_context["projects"] = [project]
+        result = self._run_worker(local_only=True)
 
-        with mock.patch("subcmds.sync.SyncBuffer") as mock_sync_buffer:
-            mock_sync_buf_instance = mock.MagicMock()
-            mock_sync_buf_instance.Finish.return_value = True
-            mock_sync_buffer.return_value = mock_sync_buf_instance
-
-            result_obj = self.cmd._SyncProjectList(opt, [0])
-            result = result_obj.results[0]
-
-            self.assertTrue(result.fetch_success)
-            self.assertTrue(result.checkout_success)
-            project.Sync_NetworkHalf.assert_not_called()
-            project.Sync_LocalHalf.assert_called_once()
+        self.assertTrue(result.fetch_success)
+        self.assertTrue(result.checkout_success)
+        self.projA.Sync_NetworkHalf.assert_not_called()
+        self.projA.Sync_LocalHalf.assert_called_once()
 
     def test_worker_network_only(self):
         """Test _SyncProjectList with --network-only."""
-        opt = self._get_opts(["--interleaved", "--network-only"])
-        project = self.projA
-        project.Sync_NetworkHalf = mock.Mock(
-            return_value=SyncNetworkHalfResult(error=None, remote_fetched=True)
-        )
-        project.Sync_LocalHalf = mock.Mock()
-        self.mock_context["projects"] = [project]
-
-        result_obj = self.cmd._SyncProjectList(opt, [0])
-        result = result_obj.results[0]
+        result = self._run_worker(network_only=True, fetch_result=_OK_FETCH)
 
         self.assertTrue(result.fetch_success)
         self.assertTrue(result.checkout_success)
-        project.Sync_NetworkHalf.assert_called_once()
-        project.Sync_LocalHalf.assert_not_called()
+        self.projA.Sync_NetworkHalf.assert_called_once()
+        self.projA.Sync_LocalHalf.assert_not_called()